@@ -11,6 +11,10 @@ if TYPE_CHECKING:
 
 
 class Action:
+    # AI classes are Actions that live as long as their entity, so they use __slots__. Every
+    # class between them and Action has to define __slots__ for that to have any effect.
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
@@ -46,7 +50,7 @@ class PickupAction(Action):
                 if len(inventory.items) >= inventory.capacity:
                     raise exceptions.Impossible("Your inventory is full.")
 
-                self.engine.game_map.entities.remove(item)
+                self.engine.game_map.remove_entity(item)
                 item.parent = self.entity.inventory
                 inventory.items.append(item)
 
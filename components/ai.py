@@ -12,7 +12,29 @@ if TYPE_CHECKING:
     from entity import Actor
 
 
+# The eight directions an entity can move in, used by ConfusedEnemy to pick one at random.
+DIRECTIONS = (
+    (-1, -1),  # Northwest
+    (0, -1),  # North
+    (1, -1),  # Northeast
+    (-1, 0),  # West
+    (1, 0),  # East
+    (-1, 1),  # Southwest
+    (0, 1),  # South
+    (1, 1)  # Southeast
+)
+
+
+def path_to_list(path: np.ndarray) -> List[Tuple[int, int]]:
+    """ Convert a path from tcod (an array of [x, y] rows) to a list of (x, y) tuples. """
+    # Transposing gives one list of x values and one of y values, which zip pairs up into tuples
+    # without a Python-level loop. tolist() is needed so the coordinates are plain Python ints.
+    return list(zip(*path.T.tolist()))
+
+
 class BaseAI(Action):
+    __slots__ = ()
+
     entity: Actor
 
     """ Doesn't implement a perform method, since entities which will be using AI to act will have
@@ -21,36 +43,20 @@ class BaseAI(Action):
         raise NotImplementedError()
 
     """ Uses the "walkable" tiles in our map, along with some TCOD pathfinding tools to get the 
-        path from the BaseAI's parent entity to whatever their target might be. In the case of
-        the tutorial, the target will always be the player, though you could theoretically write
-        a monster that cares more about food or treasure than attacking the player. """
-    def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
-        """ Compute and return a path to the target position.
+        path from the BaseAI's parent entity to the player. Rather than searching from this entity,
+        it walks downhill on the map's distance-to-player field, which is shared by every entity on
+        the map and only computed once per turn. """
+    def get_path_to_player(self) -> List[Tuple[int, int]]:
+        """ Compute and return a path to the player.
             If there is no valid path then returns an empty list. """
+        distance = self.entity.gamemap.get_player_distance()
 
-        # Copy the walkable array
-        cost = np.array(self.entity.gamemap.tiles["walkable"], dtype=np.int8)
-
-        for entity in self.entity.gamemap.entities:
-            # Check that an entity blocks movement and the cost ins't zero (blocking).
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                # Add to the cost of a blocked position.
-                # A lower number means more enemies will crowd behind each other in hallways.
-                # A higher number means enemies will take longer paths in order to surround the
-                # player.
-                cost[entity.x, entity.y] += 10
+        # Follow the distance field down to the player and remove the starting point.
+        path: np.ndarray = tcod.path.hillclimb2d(
+            distance, (self.entity.x, self.entity.y), True, True
+        )[1:]
 
-        # Create a graph from the cost array and pass that graph to a new pathfinder.
-        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
-        pathfinder = tcod.path.Pathfinder(graph)
-
-        pathfinder.add_root((self.entity.x, self.entity.y))  # Starting position.
-
-        # Compute the path to the destination and remove the starting point.
-        path: List[List[int]] = pathfinder.path_to((dest_x, dest_y))[1:].tolist()
-
-        # Convert from List[List[int]] to List[Tuple[int, int]].
-        return [(index[0], index[1]) for index in path]
+        return path_to_list(path)
 
 
 class ConfusedEnemy(BaseAI):
@@ -58,6 +64,8 @@ class ConfusedEnemy(BaseAI):
         back to its previous AI. If an actor occupies a tile it is randomly moving into, it
         will attack. """
 
+    __slots__ = ("previous_ai", "turns_remaining")
+
     def __init__(
             self,
             entity: Actor,  # The actor who is being confused.
@@ -85,45 +93,47 @@ class ConfusedEnemy(BaseAI):
             self.entity.ai = self.previous_ai
         else:
             # Pick a random direction
-            direction_x, direction_y = random.choice(
-                [
-                    (-1, -1),  # Northwest
-                    (0, -1),  # North
-                    (1, -1),  # Northeast
-                    (-1, 0),  # West
-                    (1, 0),  # East
-                    (-1, 1),  # Southwest
-                    (0, 1),  # South
-                    (1, 1)  # Southeast
-                ]
-            )
+            direction_x, direction_y = DIRECTIONS[random.randrange(len(DIRECTIONS))]
 
             self.turns_remaining -= 1
 
+            # It's possible the actor will just bump into the wall, wasting a turn. Check for that
+            # here, rather than letting MovementAction raise an exception for it.
+            dest_x = self.entity.x + direction_x
+            dest_y = self.entity.y + direction_y
+            gamemap = self.entity.gamemap
+            if not gamemap.in_bounds(dest_x, dest_y) or not gamemap.tiles["walkable"][dest_x, dest_y]:
+                return None
+
             # The actor will either try to move or attack in the chosen random direction.
-            # It's possible the actor will just bump into the wall, wasting a turn.
             return BumpAction(self.entity, direction_x, direction_y).perform()
 
 
 class HostileEnemy(BaseAI):
+    __slots__ = ("path", "path_tiles_version")
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
         self.path: List[Tuple[int, int]] = []
+        self.path_tiles_version = 0  # The map's tiles_version when the path was found.
 
     def perform(self) -> None:
         target = self.engine.player
         dx = target.x - self.entity.x
         dy = target.y - self.entity.y
-        distance = max(abs(dx), abs(dy))  # Chebyshev distance.
 
         # Check is entity is within player's FOV. If not, then wait.
         if self.engine.game_map.visible[self.entity.x, self.entity.y]:
-            # Check if distance of target. If it is less than or equal to one (right next to player),
-            # then the monster attacks the player.
-            if distance <= 1:
+            # Check if the target is right next to the entity (a Chebyshev distance of one). If it
+            # is, then the monster attacks the player.
+            if -1 <= dx <= 1 and -1 <= dy <= 1:
                 return MeleeAction(self.entity, dx, dy).perform()
 
-            self.path = self.get_path_to(target.x, target.y)
+            # Keep following the current path if it still leads to the player, and only look for a
+            # new one when it doesn't.
+            if not self.can_follow_path(target.x, target.y):
+                self.path = self.get_path_to_player()
+                self.path_tiles_version = self.entity.gamemap.tiles_version
 
         # If entity is in player's FOV, but is not adjacent to player, move towards player.
         if self.path:
@@ -133,3 +143,21 @@ class HostileEnemy(BaseAI):
             ).perform()
 
         return WaitAction(self.entity).perform()
+
+    """ The path from the previous turn is still good if the map's tiles haven't changed since it
+        was found, the player hasn't moved from the end of it, and its next step is right next to
+        this entity and free to move into. """
+    def can_follow_path(self, dest_x: int, dest_y: int) -> bool:
+        """ Return True if the current path leads to (dest_x, dest_y) and its next step can be
+            taken. """
+        if not self.path or self.path[-1] != (dest_x, dest_y):
+            return False
+
+        if self.path_tiles_version != self.entity.gamemap.tiles_version:
+            return False  # The tiles changed since, so the path may now run through a wall.
+
+        step_x, step_y = self.path[0]
+        if not (-1 <= step_x - self.entity.x <= 1 and -1 <= step_y - self.entity.y <= 1):
+            return False
+
+        return self.entity.gamemap.get_blocking_entity_at_location(step_x, step_y) is None
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Equipment(BaseComponent):
+    __slots__ = ("weapon", "armor", "_bonuses")
+
     parent: Actor
 
     """ The weapon and armor attributes are what will hold the actual equippable entity. Both can
@@ -20,35 +22,34 @@ class Equipment(BaseComponent):
         self.weapon = weapon
         self.armor = armor
 
+        self._bonuses = (0, 0)  # (power, defense), kept up to date by _recompute_bonuses.
+        self._recompute_bonuses()
+
     """ These properties (pwr and def bonus) do the same thing, just for different things. Both 
-        calculate the 'bonus' gifted by equipment to either defense or power, based on what's
-        equipped. Notice that we take the 'power' bonus from both weapons and armor, and the same
-        applies to the 'defense' bonus. This allows you to create weapons that increase both atk and
-        def (like a spiked shield, for example), and armor that increases atk 
-        (i.e. magical armor). """
+        return the 'bonus' gifted by equipment to either defense or power, based on what's
+        equipped. They're read on every attack, but only change when something is equipped or
+        removed, so both are computed together in _recompute_bonuses and stored. """
     @property
     def defense_bonus(self) -> int:
-        bonus = 0
-
-        if self.weapon is not None and self.weapon.equippable is not None:
-            bonus += self.weapon.equippable.defense_bonus
-
-        if self.armor is not None and self.armor.equippable is not None:
-            bonus += self.armor.equippable.defense_bonus
-
-        return bonus
+        return self._bonuses[1]
 
     @property
     def power_bonus(self) -> int:
-        bonus = 0
+        return self._bonuses[0]
 
-        if self.weapon is not None and self.weapon.equippable is not None:
-            bonus += self.weapon.equippable.power_bonus
+    """ Notice that we take the 'power' bonus from both weapons and armor, and the same applies to
+        the 'defense' bonus. This allows you to create weapons that increase both atk and def (like
+        a spiked shield, for example), and armor that increases atk (i.e. magical armor). """
+    def _recompute_bonuses(self) -> None:
+        power = 0
+        defense = 0
 
-        if self.armor is not None and self.armor.equippable is not None:
-            bonus += self.armor.equippable.power_bonus
+        for item in (self.weapon, self.armor):
+            if item is not None and item.equippable is not None:
+                power += item.equippable.power_bonus
+                defense += item.equippable.defense_bonus
 
-        return bonus
+        self._bonuses = (power, defense)
 
     """ Allows us to quickly check if an Item is equipped by the player or not. """
     def item_is_equipped(self, item: Item) -> bool:
@@ -91,6 +92,7 @@ class Equipment(BaseComponent):
             self.unequip_from_slot(slot, add_message)
 
         setattr(self, slot, item)
+        self._recompute_bonuses()
 
         if add_message:
             self.equip_message(item.name)
@@ -102,6 +104,7 @@ class Equipment(BaseComponent):
             self.unequip_message(current_item.name)
 
         setattr(self, slot, None)
+        self._recompute_bonuses()
 
     """ Gets called when the player selects an equippable item. It checks the equipment's type (to
         know which slot to put it in), and then checks to see if the same item is already equipped
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Equippable(BaseComponent):
+    __slots__ = ("equipment_type", "power_bonus", "defense_bonus")
+
     parent: Item
 
     def __init__(
@@ -30,20 +32,28 @@ class Equippable(BaseComponent):
     to weapons and armor, and defining the Equippable classes this way makes that easier. You might
     also want to move these classes to their own separate files if they become very complex."""
 class Dagger(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.WEAPON, power_bonus=2)
 
 
 class Sword(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.WEAPON, power_bonus=4)
 
 
 class LeatherArmor(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, defense_bonus=1)
 
 
 class ChainMail(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, defense_bonus=3)
\ No newline at end of file
@@ -74,6 +74,8 @@ class Fighter(BaseComponent):
         self.parent.ai = None
         self.parent.name = f"remains of {self.parent.name}"
         self.parent.render_order = RenderOrder.CORPSE
+        self.gamemap.blocking_changed(self.parent)
+        self.gamemap.entities_changed()
 
         self.engine.message_log.add_message(death_message, death_message_color)
 
@@ -9,6 +9,15 @@ if TYPE_CHECKING:
 
 
 class Level(BaseComponent):
+    __slots__ = (
+        "current_level",
+        "current_xp",
+        "level_up_base",
+        "level_up_factor",
+        "xp_given",
+        "_experience_to_next_level"
+    )
+
     parent: Actor
 
     def __init__(
@@ -26,9 +35,16 @@ class Level(BaseComponent):
         self.level_up_factor = level_up_factor
         self.xp_given = xp_given
 
-    """ This represents how much experience the player needs to hit the next level. """
+        self._experience_to_next_level = self._compute_experience_to_next_level()
+
+    """ This represents how much experience the player needs to hit the next level. It only changes
+        when current_level does, so it's computed in increase_level rather than every time it's
+        read. """
     @property
     def experience_to_next_level(self) -> int:
+        return self._experience_to_next_level
+
+    def _compute_experience_to_next_level(self) -> int:
         return self.level_up_base + self.current_level * self.level_up_factor
 
     """ This property determines if the player needs to level up or not. If the current xp is 
@@ -66,6 +82,7 @@ class Level(BaseComponent):
         self.current_xp -= self.experience_to_next_level
 
         self.current_level += 1
+        self._experience_to_next_level = self._compute_experience_to_next_level()
 
     def increase_max_hp(self, amount: int = 20) -> None:
         self.parent.fighter.max_hp += amount
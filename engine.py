@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import lzma
 import pickle
-from typing import TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from tcod.console import Console
 from tcod.map import compute_fov
@@ -26,25 +26,43 @@ class Engine:
         self.player = player  # The player entity. Separate reference outside of entities for ease
         # of access. Need to access player a lot more than any other entity.
 
+        # What the FOV was last computed from. Nothing else affects the result, so update_fov can
+        # skip the computation when this hasn't changed (like when the player attacks or waits).
+        self._last_fov_key: Optional[Tuple[int, int, GameMap, int]] = None
+
     def handle_enemy_turns(self) -> None:
+        # The player and any blocking entities may have moved since the last enemy turn.
+        self.game_map.invalidate_paths()
+
         # Loop through all current Acting entities, except the player.
-        for entity in set(self.game_map.actors) - {self.player}:
+        for entity in self.game_map.actors:
+            if entity is self.player:
+                continue
             # If the Actor in question has an ai class, then execute that class's peform() function.
             if entity.ai:
                 try:
                     entity.ai.perform()
-                except:
+                except exceptions.Impossible:
                     pass  # Ignore impossible action exceptions from AI.
 
     def update_fov(self) -> None:
         """ Recompute the visible area based on the player's point of view. """
+        fov_key = (self.player.x, self.player.y, self.game_map, self.game_map.tiles_version)
+        if fov_key == self._last_fov_key:
+            return
+        self._last_fov_key = fov_key
+
         self.game_map.visible[:] = compute_fov(
             self.game_map.tiles["transparent"],  # 2D numpy array where every non-zero value is considered transparent.
             (self.player.x, self.player.y),  # origin of the fov
             radius=8  # radius of fov
         )
-        # If a tile is "visible" it should be added to "explored".
-        self.game_map.explored |= self.game_map.visible
+        # If a tile is "visible" it should be added to "explored". Usually every visible tile has
+        # been explored already, in which case explored doesn't need to be touched.
+        explored_changed = not self.game_map.explored[self.game_map.visible].all()
+        if explored_changed:
+            self.game_map.explored |= self.game_map.visible
+        self.game_map.fov_changed(explored=explored_changed)
 
     # Handles drawing the screen. Iterates through self.entities and print them to their proper
     # locations, then present the context, and clear the console, just like in main.py
@@ -70,13 +88,15 @@ class Engine:
             console=console, x=21, y=44, engine=self
         )
 
-    """ pickle.dumps serializes an object hierarchy in Python. lzma.compress compresses the data,
-        fo that it take up less space (obviously). We then use with open(filename, "wb") as f: to
-        write the file (wb means "write in binary mode"), calling f.write(save_data) to write the
+    """ pickle.dumps serializes an object hierarchy in Python. We use pickle protocol 5, which
+        frames large objects more efficiently than the default. lzma.compress compresses the data,
+        fo that it take up less space (obviously). Preset 1 is much faster than the default preset
+        for slightly bigger files, so saving doesn't freeze the game. We then use
+        with open(filename, "wb") as f: to write the file (wb means "write in binary mode"), calling f.write(save_data) to write the
         data. Because everything we are trying to save is already in the Engine class, all we have
         to do is pickle it and write the file to the disk, and voila, the game is saved. """
     def save_as(self, filename: str) -> None:
         """ Save the Engine instance as a compressed file. """
-        save_data = lzma.compress(pickle.dumps(self))
+        save_data = lzma.compress(pickle.dumps(self, protocol=5), preset=1)
         with open(filename, "wb") as f:
             f.write(save_data)
@@ -45,7 +45,7 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
@@ -57,19 +57,29 @@ class Entity:
         clone.x = x  # x and y are set here instead of in __init__()
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)  # Adds the cloned entity to GameMap's entities set.
+        gamemap.add_entity(clone)  # Adds the cloned entity to GameMap's entities set.
         return clone
 
     def place(self, x: int, y: int, gamemap: Optional[GameMap] = None) -> None:
         """ Place this entity at a new location. Handles moving across GameMaps. """
-        self.x = x
-        self.y = y
+        on_gamemap = hasattr(self, "parent") and self.parent is self.gamemap  # Possibly uninitialized.
         if gamemap:
-            if hasattr(self, "parent"):  # Possibly uninitialized.
-                if self.parent is self.gamemap:
-                    self.parent.entities.remove(self)
+            # Leave the old map before the location changes, since maps index their entities by
+            # location. The new map may already hold this entity, if it was passed to its
+            # constructor.
+            if on_gamemap:
+                self.parent.remove_entity(self)
+            if self in gamemap.entities:
+                gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        elif on_gamemap:
+            self.gamemap.move_entity(self, x, y)
+        else:
+            self.x = x
+            self.y = y
 
     def distance(self, x: int, y: int) -> float:
         """ Return the distance between the current entity and the given
@@ -77,9 +87,9 @@ class Entity:
         return math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
 
     def move(self, dx: int, dy: int) -> None:
-        # Move the entity by a given amount
-        self.x += dx
-        self.y += dy
+        # Move the entity by a given amount. The map keeps track of where its entities are, so let
+        # it do the moving.
+        self.gamemap.move_entity(self, self.x + dx, self.y + dy)
 
 
 class Actor(Entity):
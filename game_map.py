@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import numpy as np  # type: ignore
 from tcod.console import Console
+import tcod.path
 
 from entity import Actor, Item
 import tile_types
@@ -18,6 +19,29 @@ class GameMap:
         self.engine = engine
         self.width, self.height = width, height
         self.entities = set(entities)
+        # The actors in self.entities, kept separately since the engine loops over them every turn.
+        self._actors: List[Actor] = [
+            entity for entity in self.entities if isinstance(entity, Actor)
+        ]
+        # The entities in self.entities, grouped by their location. Looking up what's on a tile
+        # happens constantly (movement, attacks, targeting, mouse-over names), so this avoids
+        # scanning every entity each time. Entities on this map must be moved with move_entity()
+        # to keep it up to date.
+        self._entities_at: Dict[Tuple[int, int], List[Entity]] = {}
+        # The entities that block movement, with their coordinates kept in the arrays below (only
+        # the first len(self._blockers) entries are used). Pathfinding adds the cost of every
+        # blocker at once through these arrays, instead of looping over the entities in Python.
+        self._blockers: List[Entity] = []
+        self._blocker_slots: Dict[Entity, int] = {}  # Each blocker's index into the arrays.
+        self._blocker_xs = np.zeros(16, dtype=np.intp)
+        self._blocker_ys = np.zeros(16, dtype=np.intp)
+        for entity in self.entities:
+            self._entities_at.setdefault((entity.x, entity.y), []).append(entity)
+            self.blocking_changed(entity)
+
+        # Every array on the map is indexed [x, y] and stored in Fortran order. The root console is
+        # created with order="F" in main.py, so its tiles_rgb array has this same memory layout,
+        # and copying a map-sized array onto it is one contiguous copy rather than a strided one.
 
         # Create a 2D array filled with all the same values (wall tiles)
         # This will be the base map, which generate_dungeon will then use to
@@ -33,6 +57,77 @@ class GameMap:
 
         self.downstairs_location = (0, 0)
 
+        # Incremented by tiles_changed(), so other objects can tell when the tiles were modified.
+        self.tiles_version = 0
+
+        # Pathfinding costs shared by every entity on this map. The walkable tiles rarely change,
+        # so the base cost array is only rebuilt after tiles_changed() is called. _cost is reset
+        # from _cost_base each time _get_path_cost() is called.
+        self._cost_base: Optional[np.ndarray] = None
+        self._cost: Optional[np.ndarray] = None
+
+        # The cost of the cheapest path from every tile to the player. Every monster chases the
+        # player, so one Dijkstra pass from the player replaces a separate search per monster.
+        # Built on demand, and thrown away by invalidate_paths().
+        self._player_distance: Optional[np.ndarray] = None
+
+        # What render() drew last time, kept so that frames where nothing changed don't have to
+        # redo the work. The map background only changes when the tiles or the FOV do, and the
+        # entity glyphs only change when entities come, go, move, or change how they're drawn.
+        self._create_render_buffers()
+        self._glyphs: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # The pathfinding arrays are rebuilt from the tiles the next time they're needed.
+        state["_cost_base"] = state["_cost"] = None
+        state["_player_distance"] = None
+        state["_glyphs"] = None
+        # The render buffers are rebuilt from the tiles, so there's no need to save them.
+        del state["_background"], state["_remembered"]
+
+        # Save the map arrays as raw bytes, which is faster to pickle and compress. The boolean
+        # arrays are packed into bits, making them 8 times smaller.
+        state["tiles"] = (self.tiles.dtype, self.tiles.tobytes(order="F"))
+        state["visible"] = np.packbits(self.visible.ravel(order="F")).tobytes()
+        state["explored"] = np.packbits(self.explored.ravel(order="F")).tobytes()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # Take the packed map arrays out first, so the attributes only ever hold ndarrays.
+        tiles_dtype, tiles_data = state.pop("tiles")
+        visible_data: bytes = state.pop("visible")
+        explored_data: bytes = state.pop("explored")
+        self.__dict__.update(state)
+
+        # Rebuild the map arrays from the bytes saved by __getstate__.
+        shape = (self.width, self.height)
+        tiles = np.frombuffer(tiles_data, dtype=tiles_dtype).reshape(shape, order="F")
+        self.tiles = tiles.copy(order="F")  # frombuffer arrays are read-only.
+        self.visible = self._unpack_bools(visible_data, shape)
+        self.explored = self._unpack_bools(explored_data, shape)
+
+        self._create_render_buffers()
+
+    @staticmethod
+    def _unpack_bools(data: bytes, shape: Tuple[int, int]) -> np.ndarray:
+        """ Turn bytes written by np.packbits back into a boolean array of the given shape. """
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=shape[0] * shape[1])
+        return bits.reshape(shape, order="F").astype(bool)
+
+    def _create_render_buffers(self) -> None:
+        """ Allocate the arrays render() composes the map background in. They're allocated once,
+            in the same layout as the console, and refilled in place whenever they go stale. """
+        # The whole map as it was last drawn.
+        self._background = np.empty(
+            (self.width, self.height), dtype=tile_types.graphic_dt, order="F"
+        )
+        # How explored tiles look outside the FOV ("dark" colors, or SHROUD if unexplored). Tiles
+        # are only ever added to "explored", so this changes far less often than the FOV does.
+        self._remembered = np.empty_like(self._background)
+
+        self._background_stale = self._remembered_stale = True
+
     @property
     def gamemap(self) -> GameMap:
         return self
@@ -40,33 +135,163 @@ class GameMap:
     @property
     def actors(self) -> Iterator[Actor]:
         """ Iterate over this map's living actors. """
-        yield from (
-            entity
-            for entity in self.entities
-            if isinstance(entity, Actor) and entity.is_alive
-        )
+        yield from (actor for actor in self._actors if actor.is_alive)
 
     @property
     def items(self) -> Iterator[Item]:
         yield from (entity for entity in self.entities if isinstance(entity, Item))
 
+    def add_entity(self, entity: Entity) -> None:
+        """ Add an entity to this map. """
+        if entity in self.entities:
+            return
+
+        self.entities.add(entity)
+        if isinstance(entity, Actor):
+            self._actors.append(entity)
+        self._entities_at.setdefault((entity.x, entity.y), []).append(entity)
+        self.blocking_changed(entity)
+        self.entities_changed()
+
+    def remove_entity(self, entity: Entity) -> None:
+        """ Remove an entity from this map. """
+        self.entities.remove(entity)
+        if isinstance(entity, Actor):
+            self._actors.remove(entity)
+        self._remove_from_location(entity)
+        if entity in self._blocker_slots:
+            self._remove_blocker(entity)
+        self.entities_changed()
+
+    def move_entity(self, entity: Entity, x: int, y: int) -> None:
+        """ Move an entity on this map to a new location. """
+        self._remove_from_location(entity)
+        entity.x = x
+        entity.y = y
+        self._entities_at.setdefault((x, y), []).append(entity)
+        slot = self._blocker_slots.get(entity)
+        if slot is not None:
+            self._blocker_xs[slot] = x
+            self._blocker_ys[slot] = y
+        self._glyphs = None
+
+    def _remove_from_location(self, entity: Entity) -> None:
+        location = entity.x, entity.y
+        entities_here = self._entities_at[location]
+        entities_here.remove(entity)
+        if not entities_here:
+            del self._entities_at[location]
+
+    def blocking_changed(self, entity: Entity) -> None:
+        """ Must be called after the blocks_movement of an entity on this map changes. """
+        if entity.blocks_movement and entity not in self._blocker_slots:
+            self._add_blocker(entity)
+        elif not entity.blocks_movement and entity in self._blocker_slots:
+            self._remove_blocker(entity)
+
+    def _add_blocker(self, entity: Entity) -> None:
+        slot = len(self._blockers)
+        if slot == len(self._blocker_xs):
+            # Out of room, so double the size of the arrays.
+            self._blocker_xs = np.resize(self._blocker_xs, slot * 2)
+            self._blocker_ys = np.resize(self._blocker_ys, slot * 2)
+        self._blockers.append(entity)
+        self._blocker_slots[entity] = slot
+        self._blocker_xs[slot] = entity.x
+        self._blocker_ys[slot] = entity.y
+
+    def _remove_blocker(self, entity: Entity) -> None:
+        slot = self._blocker_slots.pop(entity)
+        last = self._blockers.pop()
+        if last is not entity:
+            # Move the last blocker into the freed slot, so the used entries stay contiguous.
+            self._blockers[slot] = last
+            self._blocker_slots[last] = slot
+            self._blocker_xs[slot] = last.x
+            self._blocker_ys[slot] = last.y
+
+    def entities_changed(self) -> None:
+        """ Must be called after an entity is added or removed, or changes how it's drawn. """
+        self._glyphs = None
+
+    def fov_changed(self, explored: bool = True) -> None:
+        """ Must be called after modifying self.visible or self.explored. Pass explored=False if
+            self.explored was left unchanged, so the explored tiles don't have to be redrawn. """
+        self._background_stale = True
+        if explored:
+            self._remembered_stale = True
+
+    def invalidate_paths(self) -> None:
+        """ Forget the distance-to-player field. The engine calls this at the start of every
+            enemy turn, since the player and anything blocking the way may have moved.
+
+            The field is rebuilt by the first lookup of the turn, so it snapshots where blocking
+            entities were at that moment. Monsters that move later in the same turn still path
+            around their old positions. That's a deliberate trade-off, so the field is built once
+            per turn instead of once per monster. """
+        self._player_distance = None
+
+    def tiles_changed(self) -> None:
+        """ Must be called after modifying self.tiles, so everything derived from them is rebuilt. """
+        self.tiles_version += 1
+        self._cost_base = self._cost = None
+        self.invalidate_paths()
+        self._background_stale = self._remembered_stale = True
+
+    def _get_path_cost(self) -> np.ndarray:
+        """ Return the shared pathfinding cost array, reset to the walkable tiles (cost 1, or 0 for
+            walls), with the cost of going through blocking entities added on top. The same array
+            is returned every time, so it's only valid until the next call. """
+        cost = self._cost
+        if self._cost_base is None or cost is None:
+            self._cost_base = np.array(self.tiles["walkable"], dtype=np.int8)
+            cost = self._cost = self._cost_base.copy(order="K")
+        else:
+            np.copyto(cost, self._cost_base)
+
+        # Add to the cost of a blocked position.
+        # A lower number means more enemies will crowd behind each other in hallways.
+        # A higher number means enemies will take longer paths in order to surround the
+        # player.
+        # Walls (a cost of zero) are left blocked, and np.add.at stacks the cost when more than one
+        # blocker shares a tile, the same as adding 10 for each blocker in turn.
+        count = len(self._blockers)
+        xs, ys = self._blocker_xs[:count], self._blocker_ys[:count]
+        np.add.at(cost, (xs, ys), 10 * (cost[xs, ys] != 0))
+
+        return cost
+
+    def get_player_distance(self) -> np.ndarray:
+        """ Return the cost of the cheapest path from every tile to the player. This is computed
+            once, the first time it's needed after invalidate_paths() is called. """
+        if self._player_distance is None:
+            player = self.engine.player
+
+            distance = tcod.path.maxarray((self.width, self.height), dtype=np.int32, order="F")
+            distance[player.x, player.y] = 0
+            tcod.path.dijkstra2d(distance, self._get_path_cost(), 2, 3)
+
+            self._player_distance = distance
+
+        return self._player_distance
+
+    def get_entities_at_location(self, x: int, y: int) -> List[Entity]:
+        """ Return the entities at the given location. The list must not be modified. """
+        return self._entities_at.get((x, y), [])
+
     def get_blocking_entity_at_location(
             self, location_x: int, location_y: int
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if (
-                    entity.blocks_movement
-                    and entity.x == location_x
-                    and entity.y == location_y
-            ):
+        for entity in self.get_entities_at_location(location_x, location_y):
+            if entity.blocks_movement:
                 return entity
 
         return None
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        for entity in self.get_entities_at_location(x, y):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
 
         return None
 
@@ -75,31 +300,50 @@ class GameMap:
         return 0 <= x < self.width and 0 <= y < self.height
 
     # Using the Console class's tiles_rgb method, we can quickly render the entire map.
-    # This method proves much faster than using the console.print method we use for
-    # individual entities.
+    # This method proves much faster than using the console.print method, so we use it for
+    # drawing entities as well.
     def render(self, console: Console) -> None:
         # Renders the map. If a tile is in the "visible" array, then draw it with the "light"
         # colors. If it isn't, but it's in the "explored" array, then draw it with the "dark"
         # colors. Otherwise, the default is "SHROUD".
-        console.tiles_rgb[0: self.width, 0: self.height] = np.select(
-            condlist=[self.visible, self.explored],
-            choicelist=[self.tiles["light"], self.tiles["dark"]],
-            default=tile_types.SHROUD
-        )
+        if self._remembered_stale:
+            np.copyto(self._remembered, tile_types.SHROUD)
+            np.copyto(self._remembered, self.tiles["dark"], where=self.explored)
+            self._remembered_stale = False
 
-        entities_sorted_for_rendering = sorted(
-            self.entities, key=lambda x: x.render_order.value
-        )
+        if self._background_stale:
+            np.copyto(self._background, self._remembered)
+            np.copyto(self._background, self.tiles["light"], where=self.visible)
+            self._background_stale = False
+
+        console.tiles_rgb[0: self.width, 0: self.height] = self._background
+
+        if self._glyphs is None:
+            self._glyphs = self._get_glyphs()
+        xs, ys, chars, colors = self._glyphs
+
+        # Only draw entities that are in the FOV. Writing straight into tiles_rgb draws all of them
+        # at once, instead of one console.print call per entity.
+        in_fov = self.visible[xs, ys]
+        xs, ys = xs[in_fov], ys[in_fov]
+        console.tiles_rgb["ch"][xs, ys] = chars[in_fov]
+        console.tiles_rgb["fg"][xs, ys] = colors[in_fov]
+
+    def _get_glyphs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """ Return the x and y coordinates, character codepoints and colors to draw for this map's
+            entities, as arrays with one entry per occupied tile. """
+        # Only the entity with the highest render order shows up on a tile, so keep that one.
+        on_top: Dict[Tuple[int, int], Entity] = {}
+        for entity in sorted(self.entities, key=lambda x: x.render_order.value):
+            on_top[entity.x, entity.y] = entity
+
+        entities = list(on_top.values())
+        xs = np.array([entity.x for entity in entities], dtype=np.intp)
+        ys = np.array([entity.y for entity in entities], dtype=np.intp)
+        chars = np.array([ord(entity.char) for entity in entities], dtype=np.int32)
+        colors = np.array([entity.color for entity in entities], dtype=np.uint8).reshape(-1, 3)
 
-        for entity in entities_sorted_for_rendering:
-            # Only print entities that are in the FOV
-            if self.visible[entity.x, entity.y]:
-                console.print(
-                    x=entity.x,
-                    y=entity.y,
-                    string=entity.char,
-                    fg=entity.color
-                )
+        return xs, ys, chars, colors
 
 
 class GameWorld:
@@ -62,6 +62,15 @@ CONFIRM_KEYS = {
     tcod.event.K_KP_ENTER
 }
 
+# Events which never change what's on screen by themselves. Handlers that do react to one of these
+# (like mouse motion) have to mark themselves dirty when they do.
+NO_REDRAW_EVENTS = (
+    tcod.event.KeyUp,
+    tcod.event.MouseButtonUp,
+    tcod.event.MouseMotion,
+    tcod.event.TextInput
+)
+
 ActionOrHandler = Union[Action, "BaseEventHandler"]
 """ An event handler return value which can trigger an action or switch active handlers. 
     If a handler is returned then it will become the active handler for future events.
@@ -73,6 +82,15 @@ ActionOrHandler = Union[Action, "BaseEventHandler"]
     BaseEventHandler or its subclasses if one was returned, or return itself. This allows us to 
     change event handlers based on the context of what happens in the actions. """
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
+    # Whether this handler has to be rendered again. The main loop only redraws the screen when
+    # this is True, and resets it after rendering. New handlers always start out dirty.
+    dirty = True
+
+    def dispatch(self, event: tcod.event.Event) -> Optional[ActionOrHandler]:
+        if not isinstance(event, NO_REDRAW_EVENTS):
+            self.dirty = True
+        return super().dispatch(event)
+
     def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
         """ Handle an event and return the next active event handler. """
         state = self.dispatch(event)
@@ -157,7 +175,9 @@ class EventHandler(BaseEventHandler):
 
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
         if self.engine.game_map.in_bounds(event.tile.x, event.tile.y):
-            self.engine.mouse_location = event.tile.x, event.tile.y
+            if self.engine.mouse_location != (event.tile.x, event.tile.y):
+                self.engine.mouse_location = event.tile.x, event.tile.y
+                self.dirty = True  # The names under the mouse need to be redrawn.
 
     def on_render(self, console: tcod.Console) -> None:
         self.engine.render(console)
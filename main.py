@@ -35,14 +35,22 @@ def main() -> None:
         root_console = tcod.Console(screen_width, screen_height, order="F")  # Create console in buffer
         try:
             while True:  # Main loop
-                root_console.clear()
-                handler.on_render(console=root_console)
-                context.present(root_console)
+                # Only redraw when something has changed, rather than after every event.
+                if handler.dirty:
+                    root_console.clear()
+                    handler.on_render(console=root_console)
+                    context.present(root_console)
+                    handler.dirty = False
 
                 try:
                     for event in tcod.event.wait():
                         context.convert_event(event)
-                        handler = handler.handle_events(event)
+                        next_handler = handler.handle_events(event)
+                        if next_handler is not handler:
+                            # Switching handlers always needs a redraw, even when switching back
+                            # to one that was drawn before (like closing a popup).
+                            next_handler.dirty = True
+                            handler = next_handler
                 except Exception:  # Handle exceptions in game
                     traceback.print_exc()  # Print error to stderr.
                     # Then print the error to the message log.
@@ -50,6 +58,7 @@ def main() -> None:
                         handler.engine.message_log.add_message(
                             traceback.format_exc(), color.error
                         )
+                    handler.dirty = True
         except exceptions.QuitWithoutSaving:
             raise
         except SystemExit:  # Save and exit.
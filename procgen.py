@@ -58,7 +58,7 @@ def place_entities(
         y = random.randint(room.y1 + 1, room.y2 - 1)
 
         # Check if there are any enemies already in target position.
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not dungeon.get_entities_at_location(x, y):
             # Dice roll. 80% chance of spawning an Orc vs. a Troll.
             if random.random() < 0.8:
                 entity_factories.orc.spawn(dungeon, x, y)
@@ -69,7 +69,7 @@ def place_entities(
         x = random.randint(room.x1 + 1, room.x2 - 1)
         y = random.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not dungeon.get_entities_at_location(x, y):
             item_chance = random.random()
 
             if item_chance < 0.3:
@@ -93,7 +93,7 @@ def place_entities(
         x = random.randint(room.x1 + 1, room.x2 - 1)
         y = random.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not dungeon.get_entities_at_location(x, y):
             spawn_chance = random.random()
 
             if spawn_chance < 0.3:
@@ -181,4 +181,6 @@ def generate_dungeon(
         # Finally, append the new room to the list.
         rooms.append(new_room)
 
+    dungeon.tiles_changed()
+
     return dungeon
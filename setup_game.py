@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 import lzma
 import pickle
 import traceback
@@ -20,6 +21,15 @@ import input_handlers
 background_image = tcod.image.load("menu_background.png")[:, :, :3]
 
 
+@functools.lru_cache()
+def get_menu_background(width: int, height: int) -> tcod.Console:
+    """ Return a console of the given size with the background image drawn on it. Converting the
+        image to semigraphics is slow, so this is only done once and the result is reused. """
+    background = tcod.Console(width, height, order="F")
+    background.draw_semigraphics(background_image, 0, 0)
+    return background
+
+
 """ The same code we used to initialize our engine in main.py. We initialize the same things here,
     but return the Engine, so that main.py can make use of it. This will help reduce the amount
     of code in main.py while also making sure that we don't waste time initializing the engine
@@ -98,7 +108,7 @@ class MainMenu(input_handlers.BaseEventHandler):
 
     def on_render(self, console: tcod.Console) -> None:
         """ Render the main menu on a background image. """
-        console.draw_semigraphics(background_image, 0, 0)
+        get_menu_background(console.width, console.height).blit(console)
 
         console.print(
             console.width // 2,